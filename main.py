@@ -1,19 +1,38 @@
 import os
-import requests
+import asyncio
+import aiohttp
+import httpx
 import feedparser
 import re
-from fastapi import FastAPI, HTTPException
+import html
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from fastapi.responses import FileResponse, ORJSONResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import BinaryIO, List, Optional
 from datetime import datetime
 import logging
 import uuid
-import io
+import orjson
+import hashlib
+import functools
+from urllib.parse import urlparse
+import time
+import threading
+import multiprocessing
+from collections import OrderedDict
 from pydub import AudioSegment
+import numpy as np
+try:
+    import av
+except ImportError:  # PyAV is optional; pydub (ffmpeg subprocess) is the fallback decoder
+    av = None
 import shutil
+import tempfile
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 # Configure FFmpeg - to find it automatically
 def setup_ffmpeg():
@@ -44,8 +63,8 @@ def setup_ffmpeg():
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Setup FFmpeg
-ffmpeg_available = setup_ffmpeg()
+# FFmpeg is detected once in the startup handler
+ffmpeg_available = False
 
 # Create directories if they don't exist
 os.makedirs("static/generated_audio", exist_ok=True)
@@ -54,7 +73,8 @@ os.makedirs("assets", exist_ok=True)
 app = FastAPI(
     title="RSS to Audio News Briefing API",
     description="Convert RSS feeds into professional audio news briefings using Murf AI",
-    version="1.1.0" # Version updated
+    version="1.1.0", # Version updated
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -67,11 +87,129 @@ app.add_middleware(
 
 # Murf API configuration
 MURF_API_KEY = os.getenv('MURF_API_KEY')
+# Validated once at startup
+MURF_API_CONFIGURED = False
 MURF_API_URL = "https://api.murf.ai/v1/speech/generate"
 
+# Feed fetching configuration
+FEED_FETCH_CONCURRENCY = 8
+FEED_FETCH_RETRIES = 3
+FEED_FETCH_BACKOFF_SECONDS = 0.5
+# Some feed hosts block aiohttp's default agent but accept feedparser's own
+FEED_USER_AGENT = feedparser.USER_AGENT
+# Response headers feedparser uses for charset detection and resolving relative links
+FEED_RESPONSE_HEADERS = ('content-type', 'content-location', 'content-language', 'etag', 'last-modified')
+
+# Parsed feeds are cached per URL and revalidated with ETag/Last-Modified once stale
+FEED_CACHE_TTL_SECONDS = 300
+FEED_CACHE_MAX_ENTRIES = 10  # matches the max_articles_per_feed upper bound
+# Any submitted URL becomes a key, so the cache is LRU-bounded rather than growing forever
+FEED_CACHE_MAX_FEEDS = 256
+_FEED_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_FEED_CACHE_LOCK = threading.Lock()
+
+# Dedicated pool so feed parsing (CPU work) doesn't block the event loop
+_PARSE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="feed-parse")
+# feedparser holds the GIL, so bigger batches are parsed across processes (created at startup)
+PROCESS_PARSE_MIN_FEEDS = 6
+_PROCESS_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# Murf latency and cost scale with characters, so briefings are capped (~3500 chars is about 4 minutes of speech)
+DEFAULT_BRIEFING_CHARS = 3500
+MAX_BRIEFING_CHARS = 8000
+# Speech shorter than this is saved as-is; a music bed isn't worth the decode/encode
+MIN_MIX_SECONDS = 5
+
+# Murf synthesis time grows with text length, so briefing segments are synthesized in parallel
+MURF_CONCURRENCY = 4
+MURF_RETRIES = 3
+MURF_BACKOFF_SECONDS = 1.0
+
+# Decoding, mixing and encoding are CPU/subprocess bound, so they get their own pool
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="audio-mix")
+
+# libmp3lame VBR quality 5 is transparent for speech and encodes faster/smaller than the defaults
+MP3_EXPORT_PARAMETERS = ["-q:a", "5"]
+
+# Generated briefings are cached on disk (shared by all workers) and pruned by age and total size
+GENERATED_AUDIO_DIR = "static/generated_audio"
+BRIEFING_CACHE_MAX_AGE_DAYS = 7
+BRIEFING_CACHE_MAX_BYTES = 500 * 1024 * 1024
+
 # Path to my background music file
 BACKGROUND_MUSIC_PATH = "assets/corporate-technology-196202.mp3"
 
+# -15 dB, applied once to the decoded background samples
+BACKGROUND_MUSIC_GAIN = 10 ** (-15 / 20)
+
+def _decode_pcm_av(source, frame_rate: Optional[int]) -> tuple[np.ndarray, int]:
+    # Explicit read mode: av.open() otherwise infers it from source.mode, and a SpooledTemporaryFile
+    # ('w+b') would be opened as an output container
+    with av.open(source, mode="r") as container:
+        stream = container.streams.audio[0]
+        rate = frame_rate or stream.codec_context.sample_rate
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=rate)
+        chunks = []
+        for frame in container.decode(stream):
+            chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+        chunks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None))
+    samples = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int16)
+    return samples, rate
+
+def decode_pcm(source, frame_rate: Optional[int] = None) -> tuple[np.ndarray, int]:
+    """Decodes audio (path or file object) to mono 16-bit samples, resampled to frame_rate if given.
+
+    Uses PyAV in-process when installed, otherwise pydub's ffmpeg subprocess. Mono is plenty for a
+    spoken briefing and halves the mixing/encoding work.
+    """
+    if av is not None:
+        try:
+            return _decode_pcm_av(source, frame_rate)
+        except Exception as e:
+            logger.warning(f"PyAV decode failed, falling back to pydub: {e}")
+            if hasattr(source, "seek"):
+                source.seek(0)
+    audio = AudioSegment.from_file(source).set_channels(1).set_sample_width(2)
+    if frame_rate:
+        audio = audio.set_frame_rate(frame_rate)
+    return np.frombuffer(audio.raw_data, dtype=np.int16), audio.frame_rate
+
+def _load_quiet_music(frame_rate: Optional[int] = None) -> tuple[np.ndarray, int]:
+    samples, rate = decode_pcm(BACKGROUND_MUSIC_PATH, frame_rate)
+    return (samples * BACKGROUND_MUSIC_GAIN).astype(np.int16), rate
+
+def load_background_music() -> Optional[tuple[np.ndarray, int]]:
+    """Decodes the background track once and returns (samples, frame_rate) already attenuated for mixing."""
+    if not ffmpeg_available or not _BG_EXISTS:
+        return None
+    try:
+        logger.info(f"Loading background music from {BACKGROUND_MUSIC_PATH}")
+        return _load_quiet_music()
+    except Exception as e:
+        logger.error(f"Failed to load background music: {e}")
+        return None
+
+# Background music state is filled in by the startup handler so requests never touch the filesystem for it
+_BG_EXISTS = False
+_BG_MUSIC: Optional[tuple[np.ndarray, int]] = None
+# Background samples resampled to the frame rate of the speech they are mixed with
+_BG_PCM: dict[int, np.ndarray] = {}
+
+def _background_pcm(frame_rate: int) -> np.ndarray:
+    """Returns the attenuated background track as mono 16-bit samples at the given frame rate."""
+    pcm = _BG_PCM.get(frame_rate)
+    if pcm is not None:
+        return pcm
+
+    if _BG_MUSIC is not None and _BG_MUSIC[1] == frame_rate:
+        pcm = _BG_MUSIC[0]
+    else:
+        logger.info(f"Loading background music from {BACKGROUND_MUSIC_PATH} at {frame_rate} Hz")
+        pcm, _ = _load_quiet_music(frame_rate)
+    if _BG_MUSIC is not None:
+        _BG_PCM[frame_rate] = pcm
+    return pcm
+
 # Request/Response Models
 class GenerateBriefingRequest(BaseModel):
     feeds: List[str] = Field(..., description="List of RSS feed URLs", example=[
@@ -82,6 +220,22 @@ class GenerateBriefingRequest(BaseModel):
     audio_format: Optional[str] = Field("MP3", description="Audio format (MP3, WAV, FLAC)")
     # Added max_articles_per_feed parameter
     max_articles_per_feed: Optional[int] = Field(3, description="Max articles per feed", ge=1, le=10)
+    max_briefing_chars: Optional[int] = Field(DEFAULT_BRIEFING_CHARS, description="Max characters of briefing text sent to Murf",
+                                              ge=500, le=MAX_BRIEFING_CHARS)
+
+    @field_validator('feeds')
+    @classmethod
+    def drop_invalid_feeds(cls, feeds: List[str]) -> List[str]:
+        # Malformed URLs would only burn a network timeout, so drop them before fetching
+        valid = []
+        for url in feeds:
+            url = url.strip()
+            parsed = urlparse(url)
+            if parsed.scheme in ('http', 'https') and parsed.netloc:
+                valid.append(url)
+            else:
+                logger.warning(f"Ignoring invalid feed URL: {url!r}")
+        return valid
 
 
 class BriefingResponse(BaseModel):
@@ -90,9 +244,11 @@ class BriefingResponse(BaseModel):
     briefing_text: str
     audio_length_seconds: float
     characters_used: int
-    characters_remaining: int
+    # None when the briefing was served from cache: no Murf call was made, so the balance is unknown
+    characters_remaining: Optional[int] = None
     articles_count: int
     sources: List[str]
+    cached: bool = False
 
 class ErrorResponse(BaseModel):
     success: bool = False
@@ -100,181 +256,557 @@ class ErrorResponse(BaseModel):
     details: Optional[str] = None
 
 # Utility Functions
+_TAG_RE = re.compile(r'<[^>]+>')
+_NON_WORD_RE = re.compile(r'\W+')
+_AUDIO_NAME_RE = re.compile(r'[\w-]+\.mp3')
+
 def clean_text(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r'<[^>]+>', '', text)
-    text = ' '.join(text.split())
-    text = text.replace('&amp;', 'and').replace('&lt;', '<').replace('&gt;', '>')
-    return text
+    # html.unescape handles every named/numeric entity in a single pass
+    return ' '.join(html.unescape(_TAG_RE.sub('', text)).split())
+
+def title_key(title: str) -> str:
+    """Normalizes a headline (lowercase, no punctuation/whitespace) so wire stories match across feeds."""
+    return _NON_WORD_RE.sub('', title.lower())[:64]
+
+_SOURCE_MAPPING = {
+    "reuters": "Reuters", "nytimes": "New York Times", "techcrunch": "TechCrunch",
+    "bbc": "BBC News", "cnn": "CNN", "wsj": "Wall Street Journal"
+}
 
+@functools.lru_cache(maxsize=256)
 def get_source_name(feed_url: str) -> str:
-    source_mapping = {
-        "reuters": "Reuters", "nytimes": "New York Times", "techcrunch": "TechCrunch",
-        "bbc": "BBC News", "cnn": "CNN", "wsj": "Wall Street Journal"
-    }
     feed_lower = feed_url.lower()
-    for key, name in source_mapping.items():
+    for key, name in _SOURCE_MAPPING.items():
         if key in feed_lower:
             return name
     try:
-        from urllib.parse import urlparse
         domain = urlparse(feed_url).netloc
         return domain.replace('www.', '').split('.')[0].title()
     except:
         return "News Source"
 
+def _get_cached_feed(feed_url: str) -> Optional[dict]:
+    with _FEED_CACHE_LOCK:
+        entry = _FEED_CACHE.get(feed_url)
+        if entry is not None:
+            _FEED_CACHE.move_to_end(feed_url)
+        return entry
+
+def _store_cached_feed(feed_url: str, etag: Optional[str], modified: Optional[str], entries: list):
+    with _FEED_CACHE_LOCK:
+        _FEED_CACHE[feed_url] = {
+            'etag': etag,
+            'modified': modified,
+            'entries': entries,
+            'expiry': time.monotonic() + FEED_CACHE_TTL_SECONDS,
+        }
+        _FEED_CACHE.move_to_end(feed_url)
+        while len(_FEED_CACHE) > FEED_CACHE_MAX_FEEDS:
+            _FEED_CACHE.popitem(last=False)
+
+def _refresh_cached_feed(feed_url: str):
+    with _FEED_CACHE_LOCK:
+        entry = _FEED_CACHE.get(feed_url)
+        if entry:
+            entry['expiry'] = time.monotonic() + FEED_CACHE_TTL_SECONDS
+            _FEED_CACHE.move_to_end(feed_url)
+
+async def _fetch(session: aiohttp.ClientSession, sem: asyncio.Semaphore, feed_url: str) -> tuple:
+    """Downloads a feed body, retrying with exponential backoff on 5xx responses and timeouts.
+
+    Returns (feed_url, body, response_headers, cached_entries); body is None when the cached
+    entries are still valid, in which case they are returned directly.
+    """
+    cached = _get_cached_feed(feed_url)
+    if cached and cached['expiry'] > time.monotonic():
+        return feed_url, None, None, cached['entries']
+
+    headers = {}
+    if cached and cached['etag']:
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached['modified']:
+        headers['If-Modified-Since'] = cached['modified']
+
+    async with sem:
+        for attempt in range(FEED_FETCH_RETRIES):
+            try:
+                async with session.get(feed_url, headers=headers) as resp:
+                    if resp.status == 304 and cached:
+                        _refresh_cached_feed(feed_url)
+                        return feed_url, None, None, cached['entries']
+                    if resp.status >= 500 and attempt < FEED_FETCH_RETRIES - 1:
+                        logger.warning(f"Feed {feed_url} returned {resp.status}, retrying...")
+                    else:
+                        resp.raise_for_status()
+                        body = await resp.read()
+                        # Plain dict with lowercase keys so it pickles and matches what feedparser expects
+                        response_headers = {name: resp.headers[name] for name in FEED_RESPONSE_HEADERS
+                                            if name in resp.headers}
+                        return feed_url, body, response_headers, None
+            except asyncio.TimeoutError:
+                if attempt == FEED_FETCH_RETRIES - 1:
+                    raise
+                logger.warning(f"Timed out fetching feed {feed_url}, retrying...")
+            await asyncio.sleep(FEED_FETCH_BACKOFF_SECONDS * 2 ** attempt)
+
+async def fetch_all(feed_urls: List[str]) -> list:
+    """Fetches all feed bodies concurrently; failed fetches come back as exceptions."""
+    sem = asyncio.Semaphore(FEED_FETCH_CONCURRENCY)
+    # Short connect/read limits so dead hosts fail fast instead of holding up the whole briefing
+    timeout = aiohttp.ClientTimeout(total=15, sock_connect=3, sock_read=10)
+    connector = aiohttp.TCPConnector(limit_per_host=4, limit=64)
+    headers = {'User-Agent': FEED_USER_AGENT}
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=headers) as session:
+        return await asyncio.gather(*[_fetch(session, sem, url) for url in feed_urls], return_exceptions=True)
+
+def new_process_parse_pool() -> ProcessPoolExecutor:
+    # Workers start lazily from inside the running server, so never fork it (threads, open sockets);
+    # forkserver where the platform has it, spawn otherwise (Windows)
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(start_method))
+
+def _replace_broken_parse_pool(broken: ProcessPoolExecutor):
+    """Swaps in a fresh process pool after a worker died; a broken pool rejects all further work."""
+    global _PROCESS_PARSE_POOL
+    if _PROCESS_PARSE_POOL is not broken:
+        return  # another request already replaced it
+    logger.error("Feed parse process pool is broken (a worker died); recreating it")
+    broken.shutdown(wait=False, cancel_futures=True)
+    _PROCESS_PARSE_POOL = new_process_parse_pool()
+
+def _parse_feed(body: bytes, response_headers: dict) -> List[dict]:
+    """Parses a feed body into cleaned title/summary entries.
+
+    Runs in a worker process for large batches, so it takes and returns only picklable data.
+    """
+    entries = []
+    parsed = feedparser.parse(body, response_headers=response_headers)
+    for entry in parsed.entries[:FEED_CACHE_MAX_ENTRIES]:
+        entries.append({
+            'title': clean_text(entry.get("title", "")),
+            'summary': clean_text(entry.get("summary", entry.get("description", "")))[:197] + "...",
+        })
+    return entries
+
 # Accepts max_per_feed to fetch a variable number of articles
-def fetch_rss_articles(feed_urls: List[str], max_per_feed: int) -> tuple[List[dict], List[str]]:
+async def fetch_rss_articles(feed_urls: List[str], max_per_feed: int) -> tuple[List[dict], List[str]]:
     all_articles, sources_used = [], []
-    for feed_url in feed_urls:
+    if not feed_urls:
+        return all_articles, sources_used
+
+    # Download every feed concurrently, then parse off the event loop
+    fetched = await fetch_all(feed_urls)
+    feed_entries, to_parse = {}, {}
+    for feed_url, result in zip(feed_urls, fetched):
+        if isinstance(result, BaseException):
+            logger.error(f"Error fetching feed {feed_url}: {result}")
+            continue
+        _, body, response_headers, cached_entries = result
+        if body is None:
+            feed_entries[feed_url] = cached_entries
+        else:
+            to_parse[feed_url] = (body, response_headers)
+
+    # Process pool only pays off past a few bodies to parse; below that the IPC overhead dominates
+    pool = _PARSE_POOL
+    if _PROCESS_PARSE_POOL is not None and len(to_parse) >= PROCESS_PARSE_MIN_FEEDS:
+        pool = _PROCESS_PARSE_POOL
+    loop = asyncio.get_running_loop()
+    parse_jobs = {}
+    for feed_url, (body, response_headers) in to_parse.items():
         try:
-            feed = feedparser.parse(feed_url)
-            if not feed.entries:
-                logger.warning(f"No articles found in feed: {feed_url}")
+            job = loop.run_in_executor(pool, _parse_feed, body, response_headers)
+        except BrokenProcessPool:
+            # Finish this batch in threads; the next large batch gets the recreated pool
+            _replace_broken_parse_pool(pool)
+            pool = _PARSE_POOL
+            job = loop.run_in_executor(pool, _parse_feed, body, response_headers)
+        parse_jobs[feed_url] = (response_headers.get('etag'), response_headers.get('last-modified'), job)
+
+    parsed = await asyncio.gather(*[job for _, _, job in parse_jobs.values()], return_exceptions=True)
+    if pool is not _PARSE_POOL and any(isinstance(entries, BrokenProcessPool) for entries in parsed):
+        _replace_broken_parse_pool(pool)
+    for (feed_url, (etag, modified, _)), entries in zip(parse_jobs.items(), parsed):
+        if isinstance(entries, BaseException):
+            logger.error(f"Error parsing feed {feed_url}: {entries}")
+            continue
+        # Empty parses (error pages served with a 200, broken XML) are retried next time, not cached
+        if entries:
+            _store_cached_feed(feed_url, etag, modified, entries)
+        feed_entries[feed_url] = entries
+
+    # The same wire story often shows up in several feeds; only the first copy gets spoken
+    seen_titles = set()
+    duplicates = 0
+    for feed_url in feed_urls:
+        if feed_url not in feed_entries:
+            continue
+        entries = feed_entries[feed_url]
+        if not entries:
+            logger.warning(f"No articles found in feed: {feed_url}")
+            continue
+
+        source_name = get_source_name(feed_url)
+        articles = []
+        for entry in entries[:max_per_feed]:
+            if not entry['title']:
                 continue
-            
-            source_name = get_source_name(feed_url)
-            if source_name not in sources_used:
-                sources_used.append(source_name)
-
-            for entry in feed.entries[:max_per_feed]: 
-                title = clean_text(entry.get("title", ""))
-                summary = clean_text(entry.get("summary", entry.get("description", "")))[:197] + "..."
-                if title:
-                    all_articles.append({'source': source_name, 'title': title, 'summary': summary})
-        except Exception as e:
-            logger.error(f"Error fetching feed {feed_url}: {e}")
+            key = title_key(entry['title'])
+            if key in seen_titles:
+                duplicates += 1
+                continue
+            seen_titles.add(key)
+            articles.append({'source': source_name, **entry})
+        if not articles:
             continue
+        if source_name not in sources_used:
+            sources_used.append(source_name)
+        all_articles.extend(articles)
+
+    if duplicates:
+        logger.info(f"Skipped {duplicates} duplicate article(s) across feeds")
     return all_articles, sources_used
 
-def format_news_briefing(articles: List[dict]) -> str:
+def build_briefing_segments(articles: List[dict],
+                            max_chars: int = DEFAULT_BRIEFING_CHARS) -> tuple[List[str], List[dict]]:
+    """Returns the briefing as (intro + one segment per article + outro, articles actually included)."""
     if not articles:
-        return "No news articles available at this time."
+        return ["No news articles available at this time."], []
     current_date = datetime.now().strftime("%A, %B %d")
-    briefing = f"Good morning from Durgapur. Here is your news briefing for {current_date}.\n\n"
+    outro = "That concludes your news briefing. Have a great day!"
+    parts = [f"Good morning from Durgapur. Here is your news briefing for {current_date}.\n\n"]
+    total_chars = len(parts[0]) + len(outro)
     # Increased total article limit from 8 to 20
-    for i, article in enumerate(articles[:20]):
+    selected = articles[:20]
+    included = []
+    for i, article in enumerate(selected):
         prefix = "From" if i == 0 else "Next, from"
-        briefing += f"{prefix} {article['source']}... {article['title']}. {article['summary']}\n\n"
-    briefing += "That concludes your news briefing. Have a great day!"
-    return briefing
+        block = f"{prefix} {article['source']}... {article['title']}. {article['summary']}\n\n"
+        # Only whole articles make it in, so the text never gets cut mid-sentence. The first one is
+        # always kept so a tight cap never produces (and bills for) an intro/outro-only briefing.
+        if included and total_chars + len(block) > max_chars:
+            logger.info(f"Briefing capped at {max_chars} characters, skipped {len(selected) - i} article(s)")
+            break
+        parts.append(block)
+        included.append(article)
+        total_chars += len(block)
+    parts.append(outro)
+    return parts, included
 
-def mix_audio_with_music(speech_content: bytes) -> str:
-    """Mixes speech with background music and returns the path to the final file."""
+@contextlib.contextmanager
+def atomic_output_path(final_filepath: str):
+    """Yields a temp path next to final_filepath and moves it into place once fully written.
+
+    Briefing names are deterministic, so concurrent renders of the same briefing must never
+    expose a half-written file under the final (immutably cached) name.
+    """
+    tmp_path = f"{final_filepath}.{uuid.uuid4().hex}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, final_filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def save_speech_only(speech_file: BinaryIO, final_filename: str) -> str:
+    """Writes the Murf audio to disk untouched and returns its URL path."""
+    final_filepath = f"static/generated_audio/{final_filename}"
+    speech_file.seek(0)
+    with atomic_output_path(final_filepath) as tmp_path:
+        with open(tmp_path, 'wb') as f:
+            shutil.copyfileobj(speech_file, f)
+    return f"/static/generated_audio/{final_filename}"
+
+def mix_audio_with_music(speech_files: List[BinaryIO], final_filename: Optional[str] = None) -> str:
+    """Joins the speech segments (file-like objects), mixes them with music and returns the final file's path."""
+    final_filename = final_filename or f"briefing_{uuid.uuid4().hex}.mp3"
     try:
         logger.info("Starting audio mixing process...")
-        if not ffmpeg_available:
+        # Without ffmpeg or music there is nothing to mix, so skip the decode/encode round-trip.
+        # generate_audio_with_murf only requests several segments when mixing will happen.
+        if len(speech_files) == 1 and not ffmpeg_available:
             logger.warning("FFmpeg not available. Saving speech-only audio.")
-            final_filename = f"briefing_{uuid.uuid4().hex}.mp3"
-            final_filepath = f"static/generated_audio/{final_filename}"
-            with open(final_filepath, 'wb') as f:
-                f.write(speech_content)
-            return f"/static/generated_audio/{final_filename}"
-        
-        speech_audio = AudioSegment.from_file(io.BytesIO(speech_content), format="mp3")
-        
-        if not os.path.exists(BACKGROUND_MUSIC_PATH):
-            logger.warning(f"Background music file not found at {BACKGROUND_MUSIC_PATH}. Creating speech-only audio.")
-            final_filename = f"briefing_{uuid.uuid4().hex}.mp3"
-            final_filepath = f"static/generated_audio/{final_filename}"
-            speech_audio.export(final_filepath, format="mp3")
-            return f"/static/generated_audio/{final_filename}"
+            return save_speech_only(speech_files[0], final_filename)
+        if len(speech_files) == 1 and not _BG_EXISTS:
+            logger.warning(f"Background music file not found at {BACKGROUND_MUSIC_PATH}. Saving speech-only audio.")
+            return save_speech_only(speech_files[0], final_filename)
 
-        logger.info(f"Loading background music from {BACKGROUND_MUSIC_PATH}")
-        background_music = AudioSegment.from_file(BACKGROUND_MUSIC_PATH)
-        speech_duration = len(speech_audio)
-        
-        if len(background_music) < speech_duration:
-            loops_needed = (speech_duration // len(background_music)) + 1
-            background_music = background_music * loops_needed
-        
-        background_music = background_music[:speech_duration]
-        quiet_music = background_music - 15
-        final_audio = quiet_music.overlay(speech_audio)
+        # Segments are joined as decoded samples: each encoded file carries its own ID3/Info header
+        # and encoder padding, so concatenated bytes would misreport the length and gap at the joins
+        speech, frame_rate = decode_pcm(speech_files[0])
+        if len(speech_files) > 1:
+            speech = np.concatenate([speech] + [decode_pcm(f, frame_rate)[0] for f in speech_files[1:]])
+
+        final_samples = speech
+        if speech.size < MIN_MIX_SECONDS * frame_rate:
+            if len(speech_files) == 1:
+                logger.info("Speech is too short to mix. Saving speech-only audio.")
+                return save_speech_only(speech_files[0], final_filename)
+            logger.info("Speech is too short to mix. Exporting joined speech without music.")
+        else:
+            try:
+                # Loop, trim and overlay the music in one numpy pass over raw 16-bit samples
+                music = _background_pcm(frame_rate)
+                if music.size < speech.size:
+                    music = np.tile(music, speech.size // music.size + 1)
+                mixed = music[:speech.size].astype(np.int32) + speech
+                np.clip(mixed, -32768, 32767, out=mixed)
+                final_samples = mixed.astype(np.int16)
+            except Exception as e:
+                # Murf has already been paid for the speech, so still deliver it without music
+                logger.error(f"Error mixing background music: {e}. Exporting speech without music.")
+        final_audio = AudioSegment(final_samples.tobytes(), frame_rate=frame_rate, sample_width=2, channels=1)
 
-        final_filename = f"briefing_{uuid.uuid4().hex}.mp3"
         final_filepath = f"static/generated_audio/{final_filename}"
         
         logger.info(f"Exporting final audio to {final_filepath}")
-        final_audio.export(final_filepath, format="mp3")
+        with atomic_output_path(final_filepath) as tmp_path:
+            # export() returns the still-open output file; close it before it is moved into place
+            final_audio.export(tmp_path, format="mp3", parameters=MP3_EXPORT_PARAMETERS).close()
         logger.info(f"Successfully mixed audio and saved to {final_filepath}")
 
         return f"/static/generated_audio/{final_filename}"
 
     except Exception as e:
         logger.error(f"Error during audio mixing: {e}")
+        if len(speech_files) > 1:
+            # Decoding or encoding failed; separate segments can't be stored as one file without both
+            raise HTTPException(status_code=500, detail=f"Failed to process audio: {str(e)}")
         try:
             logger.info("Attempting to save speech-only audio as fallback...")
-            final_filename = f"briefing_{uuid.uuid4().hex}.mp3"
-            final_filepath = f"static/generated_audio/{final_filename}"
-            with open(final_filepath, 'wb') as f:
-                f.write(speech_content)
-            logger.info(f"Successfully saved speech-only audio to {final_filepath}")
-            return f"/static/generated_audio/{final_filename}"
+            audio_url = save_speech_only(speech_files[0], final_filename)
+            logger.info(f"Successfully saved speech-only audio to {audio_url}")
+            return audio_url
         except Exception as fallback_error:
             logger.error(f"Fallback audio save also failed: {fallback_error}")
             raise HTTPException(status_code=500, detail=f"Failed to process audio: {str(e)}")
 
-def generate_audio_with_murf(text: str, voice_id: str, audio_format: str) -> dict:
-    """Send text to Murf, get audio, mix it with music, and return local URL."""
-    logger.info(f"Generating audio with Murf API - {len(text)} characters")
-    # Switched to standard 'api-key' header, which is less prone to issues.
-    headers = {"Content-Type": "application/json", "api-key": MURF_API_KEY}
-    payload = {"text": text, "voiceId": voice_id, "format": audio_format}
-    
+def _murf_error_details(error: Exception) -> str:
+    """Extracts Murf's errorMessage from a failed response, falling back to the exception text."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return str(error)
     try:
-        response = requests.post(MURF_API_URL, json=payload, headers=headers)
-        response.raise_for_status()
-        
-        response_data = response.json()
+        return orjson.loads(response.content).get("errorMessage", str(error))
+    except Exception:
+        return str(error)
+
+async def _murf_generate(client: httpx.AsyncClient, payload: dict, headers: dict) -> dict:
+    """POSTs a synthesis request, backing off exponentially on 429 and 5xx responses."""
+    for attempt in range(MURF_RETRIES):
+        response = await client.post(MURF_API_URL, content=orjson.dumps(payload), headers=headers)
+        retryable = response.status_code == 429 or response.status_code >= 500
+        if not retryable or attempt == MURF_RETRIES - 1:
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        delay = MURF_BACKOFF_SECONDS * 2 ** attempt
+        logger.warning(f"Murf returned {response.status_code}, retrying in {delay:.1f}s...")
+        await asyncio.sleep(delay)
+
+async def _synthesize(client: httpx.AsyncClient, sem: asyncio.Semaphore, text: str, voice_id: str,
+                      audio_format: str, headers: dict) -> tuple[dict, BinaryIO]:
+    """Synthesizes one chunk of text and downloads the audio into a spooled temp file."""
+    payload = {"text": text, "voiceId": voice_id, "format": audio_format}
+    async with sem:
+        response_data = await _murf_generate(client, payload, headers)
         murf_audio_url = response_data.get("audioFile")
         if not murf_audio_url:
             raise HTTPException(status_code=500, detail="No audio file URL in Murf response")
 
-        logger.info("Downloading speech audio from Murf...")
-        speech_response = requests.get(murf_audio_url)
-        speech_response.raise_for_status()
-        
-        final_audio_path = mix_audio_with_music(speech_response.content)
+        # Stream straight into a spooled file instead of holding the whole MP3 in memory
+        spool = tempfile.SpooledTemporaryFile(max_size=2 * 1024 * 1024)
+        try:
+            async with client.stream("GET", murf_audio_url) as speech_response:
+                if speech_response.is_error:
+                    await speech_response.aread()
+                speech_response.raise_for_status()
+                async for chunk in speech_response.aiter_bytes(64 * 1024):
+                    spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+    spool.seek(0)
+    return response_data, spool
+
+async def generate_audio_with_murf(segments: List[str], voice_id: str, audio_format: str,
+                                   final_filename: Optional[str] = None) -> dict:
+    """Send text to Murf, get audio, mix it with music, and return local URL."""
+    # Segments are joined after decoding, so they're only synthesized separately when the audio
+    # gets decoded and mixed anyway; speech-only briefings stay one request saved as-is.
+    # _BG_MUSIC (not just the file existing) guarantees the track actually decoded at startup.
+    if ffmpeg_available and _BG_MUSIC is not None:
+        chunks = segments
+    else:
+        chunks = [''.join(segments)]
+    logger.info(f"Generating audio with Murf API - {sum(len(c) for c in chunks)} characters in {len(chunks)} request(s)")
+    # Switched to standard 'api-key' header, which is less prone to issues.
+    headers = {"Content-Type": "application/json", "api-key": MURF_API_KEY}
+
+    try:
+        client: httpx.AsyncClient = app.state.http
+        sem = asyncio.Semaphore(MURF_CONCURRENCY)
+        results = await asyncio.gather(
+            *[_synthesize(client, sem, chunk, voice_id, audio_format, headers) for chunk in chunks],
+            return_exceptions=True
+        )
+        spools = [result[1] for result in results if not isinstance(result, BaseException)]
+        try:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            responses = [response_data for response_data, _ in results]
+
+            loop = asyncio.get_running_loop()
+            final_audio_path = await loop.run_in_executor(_AUDIO_POOL, mix_audio_with_music, spools, final_filename)
+        finally:
+            for spool in spools:
+                spool.close()
 
         return {
             "audio_url": final_audio_path,
-            "audio_length_seconds": response_data.get("audioLengthInSeconds", 0),
-            "characters_used": response_data.get("consumedCharacterCount", 0),
-            "characters_remaining": response_data.get("remainingCharacterCount", 0)
+            "audio_length_seconds": sum(r.get("audioLengthInSeconds", 0) for r in responses),
+            "characters_used": sum(r.get("consumedCharacterCount", 0) for r in responses),
+            # Requests ran concurrently, so the lowest reported balance is the most recent one
+            "characters_remaining": min(r.get("remainingCharacterCount", 0) for r in responses)
         }
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Murf API request failed: {e.response.text if e.response else e}")
-        error_details = e.response.json().get("errorMessage", str(e)) if e.response else str(e)
-        raise HTTPException(status_code=500, detail=f"Murf API communication error: {error_details}")
+    except httpx.HTTPError as e:
+        response = getattr(e, "response", None)
+        logger.error(f"Murf API request failed: {response.text if response is not None else e}")
+        raise HTTPException(status_code=500, detail=f"Murf API communication error: {_murf_error_details(e)}")
+
+# Briefing cache
+# Briefing files are named by content hash (or a uuid), so a given URL never changes
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def briefing_cache_key(briefing_text: str, voice_id: str, audio_format: str) -> str:
+    canonical = orjson.dumps([briefing_text, voice_id, audio_format])
+    return hashlib.sha1(canonical).hexdigest()
+
+# Only properties of the audio itself are cached; Murf usage figures belong to the original call
+_CACHED_AUDIO_FIELDS = ("audio_url", "audio_length_seconds")
+
+def load_cached_briefing(cache_key: str) -> Optional[dict]:
+    """Returns the stored audio metadata if both the audio file and its side-car JSON exist."""
+    audio_path = os.path.join(GENERATED_AUDIO_DIR, f"briefing_{cache_key}.mp3")
+    meta_path = os.path.join(GENERATED_AUDIO_DIR, f"briefing_{cache_key}.json")
+    if not (os.path.exists(audio_path) and os.path.exists(meta_path)):
+        return None
+    try:
+        with open(meta_path, "rb") as f:
+            metadata = orjson.loads(f.read())
+        return {field: metadata[field] for field in _CACHED_AUDIO_FIELDS}
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable briefing cache entry {meta_path}: {e}")
+        return None
+
+def save_cached_briefing(cache_key: str, audio_data: dict):
+    meta_path = os.path.join(GENERATED_AUDIO_DIR, f"briefing_{cache_key}.json")
+    try:
+        with atomic_output_path(meta_path) as tmp_path:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps({field: audio_data[field] for field in _CACHED_AUDIO_FIELDS}))
+    except OSError as e:
+        logger.warning(f"Failed to write briefing cache entry {meta_path}: {e}")
+
+def prune_generated_audio():
+    """Deletes briefings older than the max age, then the oldest ones until under the size cap."""
+    cutoff = time.time() - BRIEFING_CACHE_MAX_AGE_DAYS * 24 * 3600
+    briefings = []
+    try:
+        for entry in os.scandir(GENERATED_AUDIO_DIR):
+            if entry.is_file() and entry.name.endswith(".mp3"):
+                stat = entry.stat()
+                briefings.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError as e:
+        logger.warning(f"Failed to scan {GENERATED_AUDIO_DIR} for pruning: {e}")
+        return
+
+    briefings.sort()
+    total_size = sum(size for _, size, _ in briefings)
+    removed = 0
+    for mtime, size, path in briefings:
+        if mtime >= cutoff and total_size <= BRIEFING_CACHE_MAX_BYTES:
+            break
+        # Drop the side-car first so a concurrent lookup never sees metadata without audio
+        for stale in (os.path.splitext(path)[0] + ".json", path):
+            try:
+                os.remove(stale)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove {stale}: {e}")
+        total_size -= size
+        removed += 1
+    if removed:
+        logger.info(f"Pruned {removed} cached briefing(s) from {GENERATED_AUDIO_DIR}")
+
+# Lifecycle
+@app.on_event("startup")
+async def startup():
+    global ffmpeg_available, MURF_API_CONFIGURED, _BG_EXISTS, _BG_MUSIC, _PROCESS_PARSE_POOL
+    # One-time environment checks, cached so the request path does no filesystem probing
+    ffmpeg_available = setup_ffmpeg()
+    MURF_API_CONFIGURED = bool(MURF_API_KEY and 'PASTE_YOUR_API_KEY_HERE' not in MURF_API_KEY)
+    if not MURF_API_CONFIGURED:
+        logger.error("MURF_API_KEY is not configured; briefing generation will be unavailable.")
+    _BG_EXISTS = os.path.exists(BACKGROUND_MUSIC_PATH)
+    _BG_MUSIC = load_background_music()
+    logger.info(f"FFmpeg available: {ffmpeg_available}, background music exists: {_BG_EXISTS}")
+
+    _PROCESS_PARSE_POOL = new_process_parse_pool()
+    # One pooled client for all Murf traffic so TCP/TLS connections are reused across briefings
+    app.state.http = httpx.AsyncClient(
+        timeout=30,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=8)
+    )
+
+@app.on_event("shutdown")
+async def shutdown():
+    await app.state.http.aclose()
+    if _PROCESS_PARSE_POOL is not None:
+        _PROCESS_PARSE_POOL.shutdown(wait=False, cancel_futures=True)
 
 # API Endpoints
 @app.post("/generate-briefing", response_model=BriefingResponse, tags=["Audio Generation"])
-def generate_briefing(request: GenerateBriefingRequest):
+async def generate_briefing(request: GenerateBriefingRequest, background_tasks: BackgroundTasks):
     if not request.feeds:
         raise HTTPException(status_code=400, detail="No RSS feed URLs provided")
-    if not MURF_API_KEY or 'PASTE_YOUR_API_KEY_HERE' in MURF_API_KEY:
+    if not MURF_API_CONFIGURED:
         raise HTTPException(status_code=500, detail="Murf API key is not configured on the server.")
     
     try:
         # Pass the new parameter to the fetch function
-        articles, sources = fetch_rss_articles(request.feeds, request.max_articles_per_feed)
+        articles, _ = await fetch_rss_articles(request.feeds, request.max_articles_per_feed)
         if not articles:
             raise HTTPException(status_code=400, detail="Could not find any articles from the provided feeds.")
         
-        briefing_text = format_news_briefing(articles)
+        segments, included = build_briefing_segments(articles, request.max_briefing_chars or DEFAULT_BRIEFING_CHARS)
+        briefing_text = ''.join(segments)
+        # Report what is actually spoken, not everything that was fetched
+        spoken_sources = list(dict.fromkeys(article['source'] for article in included))
         
-        audio_data = generate_audio_with_murf(
-            text=briefing_text,
-            voice_id=request.voice_id,
-            audio_format=request.audio_format
-        )
+        # Identical briefings reuse the already rendered audio instead of calling Murf again
+        cache_key = briefing_cache_key(briefing_text, request.voice_id, request.audio_format)
+        audio_data = load_cached_briefing(cache_key)
+        if audio_data is not None:
+            logger.info(f"Serving cached briefing {cache_key}")
+            audio_data.update(characters_used=0, characters_remaining=None, cached=True)
+        else:
+            audio_data = await generate_audio_with_murf(
+                segments=segments,
+                voice_id=request.voice_id,
+                audio_format=request.audio_format,
+                final_filename=f"briefing_{cache_key}.mp3"
+            )
+            save_cached_briefing(cache_key, audio_data)
+            background_tasks.add_task(prune_generated_audio)
         
         return BriefingResponse(
             success=True,
-            articles_count=len(articles),
-            sources=sources,
+            articles_count=len(included),
+            sources=spoken_sources,
             briefing_text=briefing_text,
             **audio_data
         )
@@ -293,11 +825,19 @@ def root():
 def health_check():
     return {
         "status": "healthy", 
-        "murf_api_configured": bool(MURF_API_KEY and 'PASTE_YOUR_API_KEY_HERE' not in MURF_API_KEY),
+        "murf_api_configured": MURF_API_CONFIGURED,
         "ffmpeg_available": ffmpeg_available,
-        "background_music_exists": os.path.exists(BACKGROUND_MUSIC_PATH)
+        "background_music_exists": _BG_EXISTS
     }
 
+# Registered before the /static mount so generated audio gets long-lived cache headers
+@app.get("/static/generated_audio/{name}", include_in_schema=False)
+async def get_generated_audio(name: str):
+    path = os.path.join(GENERATED_AUDIO_DIR, name)
+    if not _AUDIO_NAME_RE.fullmatch(name) or not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Audio file not found")
+    return FileResponse(path, media_type="audio/mpeg", headers={"Cache-Control": AUDIO_CACHE_CONTROL})
+
 @app.get("/", include_in_schema=False)
 async def read_index():
     return FileResponse('static/index.html')
@@ -308,6 +848,4 @@ if __name__ == "__main__":
     import uvicorn
     print("🚀 Starting RSS to Audio News Briefing API")
     print("📖 API Documentation: http://localhost:8000/docs")
-    print(f"🎵 FFmpeg available: {ffmpeg_available}")
-    print(f"🎵 Background music exists: {os.path.exists(BACKGROUND_MUSIC_PATH)}")
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
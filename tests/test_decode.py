@@ -0,0 +1,32 @@
+import io
+import tempfile
+import wave
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("av")
+main = pytest.importorskip("main")
+
+
+def _wav_bytes(frame_rate=16000, seconds=1):
+    samples = (np.sin(np.arange(frame_rate * seconds) / 10) * 8000).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(frame_rate)
+        wav.writeframes(samples.tobytes())
+    return buf.getvalue()
+
+
+def test_pyav_decodes_spooled_temporary_file():
+    # Murf audio is downloaded into a SpooledTemporaryFile (mode 'w+b'); PyAV must read it in-process
+    with tempfile.SpooledTemporaryFile(max_size=2 * 1024 * 1024) as spool:
+        spool.write(_wav_bytes())
+        spool.seek(0)
+        samples, frame_rate = main._decode_pcm_av(spool, None)
+
+    assert frame_rate == 16000
+    assert samples.dtype == np.int16
+    assert abs(samples.size - 16000) < 100